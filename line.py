@@ -2,24 +2,55 @@
 # Imports
 # ────────────────────────────────────────────────────────────────────────────────
 import collections
-import tkinter as tk
-from tkinter import ttk
+import graphlib
+import heapq
+import math
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.patches as mpatches
+# matplotlib and tkinter are imported inside the drawing/GUI helpers so that
+# the algorithm can be used (or tested) without paying for them.
 
-import networkx as nx
+# ────────────────────────────────────────────────────────────────────────────────
+# Helper: successor map {task: [tasks that directly follow it]}
+# ────────────────────────────────────────────────────────────────────────────────
+def successors(tasks, predecessors):
+    """Invert the predecessor lists into a successor adjacency dict."""
+    succ = {t: [] for t in tasks}
+    for t in tasks:
+        for p in dict.fromkeys(predecessors.get(t, ())):   # repeated edges count once
+            succ[p].append(t)
+    return succ
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Helper: reject predecessors that are not in the task list
+# ────────────────────────────────────────────────────────────────────────────────
+def check_predecessors(tasks, predecessors):
+    """Raise ValueError if any task names a predecessor missing from *tasks*."""
+    known = set(tasks)
+    for t in tasks:
+        for p in predecessors.get(t, ()):
+            if p not in known:
+                raise ValueError(f"Task '{t}' has unknown predecessor '{p}' - "
+                                 "check precedence data.")
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Helper: deterministic tree layout (root left, successors to the right)
 # ────────────────────────────────────────────────────────────────────────────────
-def tree_lr_layout(G: nx.DiGraph, x_spacing: float = 2.0, y_spacing: float = 1.5):
+def tree_lr_layout(tasks, predecessors, x_spacing: float = 2.0, y_spacing: float = 1.5,
+                   succ=None):
     """Arrange a DAG like a left-to-right tree and return {node: (x, y)}."""
-    level = {}
-    for node in nx.topological_sort(G):
-        preds = list(G.predecessors(node))
-        level[node] = 0 if not preds else 1 + max(level[p] for p in preds)
+    if succ is None:
+        succ = successors(tasks, predecessors)
+    indeg = {t: len(set(predecessors.get(t, ()))) for t in tasks}
+
+    q = collections.deque(t for t in tasks if indeg[t] == 0)
+    level = {t: 0 for t in q}
+    while q:                                           # Kahn's algorithm
+        u = q.popleft()
+        for v in succ[u]:
+            level[v] = max(level.get(v, 0), level[u] + 1)
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                q.append(v)
 
     columns = collections.defaultdict(list)
     for node, lvl in level.items():
@@ -34,78 +65,196 @@ def tree_lr_layout(G: nx.DiGraph, x_spacing: float = 2.0, y_spacing: float = 1.5
             pos[node] = (lvl * x_spacing, (top - i) * y_spacing)
     return pos
 
+# ────────────────────────────────────────────────────────────────────────────────
+# Helper: precedence graph + layout, built once and shared
+# ────────────────────────────────────────────────────────────────────────────────
+def build_graph(tasks, predecessors):
+    """Return (succ, pos): successor map and layout of the precedence network."""
+    succ = successors(tasks, predecessors)
+    return succ, tree_lr_layout(tasks, predecessors, succ=succ)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Helper: draw the precedence graph with one artist per element type
+# ────────────────────────────────────────────────────────────────────────────────
+def draw_precedence_graph(ax, succ, pos, node_colours, node_size=2000):
+    """Draw the graph on *ax*: edges as one LineCollection, arrowheads as one
+    quiver and nodes as one scatter. *node_colours* follows the order of *succ*."""
+    from matplotlib.collections import LineCollection
+
+    edges = [(pos[u], pos[v]) for u in succ for v in succ[u]]
+    ax.add_collection(LineCollection(edges, colors='k', zorder=1))
+    xs, ys = zip(*(pos[t] for t in succ))
+    ax.scatter(xs, ys, s=node_size, c=node_colours, zorder=2)
+    for t in succ:
+        ax.text(*pos[t], str(t), ha='center', va='center',
+                fontsize=12, fontweight='bold', zorder=3)
+    ax.margins(0.1)
+    ax.set_axis_off()
+    if not edges:
+        return
+
+    # Arrowheads: node size is fixed in points, so the heads are placed in
+    # display space just outside each target node and re-placed on resize.
+    head_len = 18                                      # pixels
+    heads = ax.quiver([v[0] for _, v in edges], [v[1] for _, v in edges],
+                      [1] * len(edges), [0] * len(edges),
+                      angles='uv', scale_units='dots', scale=1, units='dots',
+                      pivot='tip', width=2, headwidth=6, headlength=9,
+                      headaxislength=8, color='k', zorder=3)
+
+    def place_heads(event=None):
+        ax.get_xlim()                                  # settle autoscaled limits
+        to_px = ax.transData.transform
+        radius = math.sqrt(node_size) / 2 * ax.figure.dpi / 72
+        tips, us, vs = [], [], []
+        for (x0, y0), (x1, y1) in zip(to_px([u for u, _ in edges]),
+                                      to_px([v for _, v in edges])):
+            length = math.hypot(x1 - x0, y1 - y0) or 1.0
+            ux, uy = (x1 - x0) / length, (y1 - y0) / length
+            tips.append((x1 - ux * radius, y1 - uy * radius))
+            us.append(ux * head_len)
+            vs.append(uy * head_len)
+        heads.set_offsets(ax.transData.inverted().transform(tips))
+        heads.set_UVC(us, vs)
+
+    place_heads()
+    ax.figure.canvas.mpl_connect('resize_event', place_heads)
+
 # ────────────────────────────────────────────────────────────────────────────────
 # NEW: exact positional-weight computation
 # ────────────────────────────────────────────────────────────────────────────────
-def compute_positional_weights(tasks, times, predecessors):
-    """Return {task: positional weight}."""
-    G = nx.DiGraph()
-    for t in tasks:
-        G.add_node(t)
-    for t, preds in predecessors.items():
-        for p in preds:
-            G.add_edge(p, t)
+def compute_positional_weights(tasks, times, predecessors, succ=None):
+    """Return {task: positional weight}; *succ* may be a prebuilt successor map."""
+    if succ is None:
+        succ = successors(tasks, predecessors)
 
-    topo = list(nx.topological_sort(G))[::-1]          # leaves → roots
+    ts = graphlib.TopologicalSorter({t: predecessors.get(t, ()) for t in tasks})
+    topo = list(ts.static_order())[::-1]               # leaves → roots
     positional_weights = {t: times[t] for t in tasks}
 
     for node in topo:                                  # accumulate successors
-        for succ in G.successors(node):
-            positional_weights[node] += positional_weights[succ]
+        for s in succ[node]:
+            positional_weights[node] += positional_weights[s]
     return positional_weights
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Line-balancing algorithm
 # ────────────────────────────────────────────────────────────────────────────────
 def line_balancing_algorithm(tasks, times, predecessors,
-                              cycle_time, heuristic="longest_task_time"):
+                              cycle_time, heuristic="longest_task_time", packing="next_fit",
+                              succ=None):
+    if not tasks:
+        raise ValueError("No tasks given - nothing to balance.")
+    if heuristic not in ("longest_task_time", "ranked_positional_weight"):
+        raise ValueError(f"Unknown heuristic '{heuristic}' - "
+                         "use 'longest_task_time' or 'ranked_positional_weight'.")
+    if packing not in ("next_fit", "first_fit"):
+        raise ValueError(f"Unknown packing '{packing}' - use 'next_fit' or 'first_fit'.")
+    check_predecessors(tasks, predecessors)
 
     total_work_content = sum(times.values())
-    min_stations = max(1, int((total_work_content + cycle_time - 0.01)//cycle_time))
+    if isinstance(total_work_content, int) and isinstance(cycle_time, int):
+        min_stations = max(1, -(-total_work_content // cycle_time))
+    else:                                              # absorb float noise, e.g. 0.1 + 0.2
+        min_stations = max(1, math.ceil(round(total_work_content / cycle_time, 9)))
 
     workstations, station_times = {}, {}
-    assigned_tasks, current_station = set(), 1
+    current_station = 1
     station_times[current_station] = 0
 
-    # followers are handy later for eligibility checks
-    followers = {t: [] for t in tasks}
-    for t in tasks:
-        for p in predecessors.get(t, []):
-            followers[p].append(t)
-
     # ---- positional weights -----------------------------
+    # reuse the caller's successor map when it already built one
     if heuristic == "ranked_positional_weight":
-        positional_weights = compute_positional_weights(tasks, times, predecessors)
+        positional_weights = compute_positional_weights(tasks, times, predecessors,
+                                                        succ=succ)
     # ------------------------------------------------------
 
-    def eligible(task):
-        return task not in assigned_tasks and all(p in assigned_tasks
-                                                  for p in predecessors.get(task, []))
-
-    while len(assigned_tasks) < len(tasks):
-        cand = [t for t in tasks if eligible(t)]
-        if not cand:
+    # ---- priority key -----------------------------------
+    if heuristic == "longest_task_time":
+        key = times
+    else:  # ranked positional weight
+        key = positional_weights
+
+    # ---- integer task ids -------------------------------
+    # The hot loops work on list positions instead of task names; the id is
+    # the task's index in `tasks`, which also breaks heap ties in input order.
+    n = len(tasks)
+    idx = {t: i for i, t in enumerate(tasks)}
+    dur = [times[t] for t in tasks]
+    entry = [(-key[t], i) for i, t in enumerate(tasks)]  # heap items, built once
+    followers = [[] for _ in range(n)]                 # successors, by id
+    remaining = [0] * n                                # unassigned predecessors
+    for i, t in enumerate(tasks):                      # one pass over the precedences
+        preds = dict.fromkeys(predecessors.get(t, ()))
+        remaining[i] = len(preds)
+        for p in preds:
+            followers[idx[p]].append(i)
+    n_assigned = 0
+
+    # Kahn-style ready set: a task enters the heap once all its predecessors
+    # are assigned
+    ready = [entry[i] for i in range(n) if remaining[i] == 0]
+    heapq.heapify(ready)
+
+    if packing == "first_fit":
+        # First-fit-decreasing: take tasks in priority order and drop each one
+        # into the earliest open station that comes no sooner than any of its
+        # predecessors and still has room.
+        earliest = [1] * n
+        while ready:
+            i = heapq.heappop(ready)[1]
+            if dur[i] > cycle_time:
+                raise ValueError(f"Task '{tasks[i]}' is longer than the cycle time.")
+            s = earliest[i]
+            while s in station_times and station_times[s] + dur[i] > cycle_time:
+                s += 1
+            workstations.setdefault(s, []).append(tasks[i])
+            station_times[s] = station_times.get(s, 0) + dur[i]
+            n_assigned += 1
+            for f in followers[i]:
+                earliest[f] = max(earliest[f], s)
+                remaining[f] -= 1
+                if remaining[f] == 0:
+                    heapq.heappush(ready, entry[f])
+        if n_assigned < n:
             raise ValueError("No eligible tasks found - check precedence data.")
-
-        if heuristic == "longest_task_time":
-            cand.sort(key=lambda t: times[t], reverse=True)
-        else:  # ranked positional weight
-            cand.sort(key=lambda t: positional_weights[t], reverse=True)
-
-        placed = False
-        for t in cand:
-            if station_times[current_station] + times[t] <= cycle_time:
-                workstations.setdefault(current_station, []).append(t)
-                station_times[current_station] += times[t]
-                assigned_tasks.add(t)
-                placed = True
-                break
-        if not placed:
-            current_station += 1
-            station_times[current_station] = 0
+    else:  # next fit: fill one station at a time
+        # tasks that do not fit the current station wait in `deferred` until
+        # the next station is opened
+        deferred = []
+        load = 0                                       # time used in current station
+        shortest = min(dur)
+        while n_assigned < n:
+            if ready and load + shortest > cycle_time:
+                deferred += ready                      # nothing can fit any more
+                ready = []
+            if not ready:
+                if not deferred:
+                    raise ValueError("No eligible tasks found - check precedence data.")
+                if load == 0:
+                    raise ValueError(f"Task '{tasks[deferred[0][1]]}' is longer than the cycle time.")
+                current_station += 1
+                station_times[current_station] = load = 0
+                ready, deferred = deferred, []
+                heapq.heapify(ready)
+                continue
+
+            item = heapq.heappop(ready)
+            i = item[1]
+            if load + dur[i] <= cycle_time:
+                workstations.setdefault(current_station, []).append(tasks[i])
+                load += dur[i]
+                station_times[current_station] = load
+                n_assigned += 1
+                for f in followers[i]:
+                    remaining[f] -= 1
+                    if remaining[f] == 0:
+                        heapq.heappush(ready, entry[f])
+            else:
+                deferred.append(item)
 
     actual_stations = len(workstations)
-    idle_time = sum(cycle_time - station_times[s] for s in station_times)
+    idle_time = actual_stations * cycle_time - total_work_content
     eff = (total_work_content / (actual_stations * cycle_time)) * 100
     metrics = dict(total_work_content=total_work_content,
                    cycle_time=cycle_time,
@@ -120,7 +269,14 @@ def line_balancing_algorithm(tasks, times, predecessors,
 # ────────────────────────────────────────────────────────────────────────────────
 # GUI
 # ────────────────────────────────────────────────────────────────────────────────
-def create_line_balancing_gui(workstations, metrics, tasks, predecessors):
+def create_line_balancing_gui(workstations, metrics, tasks, predecessors, succ=None, pos=None):
+    import tkinter as tk
+    from tkinter import ttk
+
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    import matplotlib.patches as mpatches
+
     root = tk.Tk()
     root.title("Line Balancing Results")
     root.geometry("1200x800")
@@ -135,11 +291,13 @@ def create_line_balancing_gui(workstations, metrics, tasks, predecessors):
     frame_ws = ttk.LabelFrame(results_frame, text="Workstation Assignments")
     frame_ws.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
 
+    lines = []
     for s in sorted(workstations):
         tasks_str = ", ".join(workstations[s])
-        ttk.Label(frame_ws, text=f"Station {s}: {tasks_str}").grid(sticky="w")
-        ttk.Label(frame_ws, text=f"  Total time: {metrics['station_times'][s]} sec").grid(sticky="w")
-        ttk.Label(frame_ws, text=f"  Idle time: {metrics['cycle_time'] - metrics['station_times'][s]} sec").grid(sticky="w")
+        lines.append(f"Station {s}: {tasks_str}")
+        lines.append(f"  Total time: {metrics['station_times'][s]} sec")
+        lines.append(f"  Idle time: {metrics['cycle_time'] - metrics['station_times'][s]} sec")
+    ttk.Label(frame_ws, text="\n".join(lines), justify="left").grid(sticky="w")
 
     frame_met = ttk.LabelFrame(results_frame, text="Performance Metrics")
     frame_met.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
@@ -155,47 +313,58 @@ def create_line_balancing_gui(workstations, metrics, tasks, predecessors):
     ttk.Label(frame_met, text=metrics_txt).grid(sticky="w")
 
     # Build the task-precedence graph once (shared by both graph tabs)
-    G = nx.DiGraph()
-    G.add_nodes_from(tasks)
-    for t, preds in predecessors.items():
-        for p in preds:
-            G.add_edge(p, t)
-    pos = tree_lr_layout(G)   # deterministic layout
+    if succ is None or pos is None:
+        succ, pos = build_graph(tasks, predecessors)
 
-    # 2) Precedence network tab -----------------------------------------------
+    # Graph tabs are only drawn the first time they are selected
     topo_frame = ttk.Frame(notebook)
     notebook.add(topo_frame, text="Task Precedence Network")
-
-    fig1 = plt.Figure(figsize=(8, 6))
-    ax1 = fig1.add_subplot(111)
-    nx.draw(G, pos, ax=ax1, with_labels=True, node_size=2000,
-            node_color='lightblue', font_size=12, font_weight='bold', arrowsize=20)
-    ax1.set_title('Precedence graph')
-    FigureCanvasTkAgg(fig1, topo_frame).get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-    # 3) Task-allocation tab ---------------------------------------------------
     alloc_frame = ttk.Frame(notebook)
     notebook.add(alloc_frame, text="Task Allocation")
 
-    fig2 = plt.Figure(figsize=(8, 6))
-    ax2 = fig2.add_subplot(111)
-
-    palette = ['tab:red', 'tab:green', 'tab:blue', 'tab:orange', 'tab:purple',
-               'tab:brown', 'tab:pink', 'tab:olive', 'tab:cyan']
-    colour = {}
-    for i, s in enumerate(sorted(workstations)):
-        for t in workstations[s]:
-            colour[t] = palette[i % len(palette)]
-    node_colours = [colour.get(t, 'lightgray') for t in tasks]
-
-    nx.draw(G, pos, ax=ax2, with_labels=True, node_size=2000,
-            node_color=node_colours, font_size=12, font_weight='bold', arrowsize=20)
+    # 2) Precedence network tab -----------------------------------------------
+    def draw_precedence_tab():
+        fig1 = plt.Figure(figsize=(8, 6))
+        fig1.set_layout_engine('none')     # axes fill the figure, no solver needed
+        ax1 = fig1.add_subplot(111)
+        draw_precedence_graph(ax1, succ, pos, 'lightblue')
+        ax1.set_title('Precedence graph')
+        canvas1 = FigureCanvasTkAgg(fig1, topo_frame)
+        canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas1.draw_idle()               # render once Tk is idle, coalescing redraws
 
-    patches = [mpatches.Patch(color=palette[i % len(palette)], label=f'Station {s}')
-               for i, s in enumerate(sorted(workstations))]
-    ax2.legend(handles=patches, loc='best')
-    ax2.set_title('Task allocation')
-    FigureCanvasTkAgg(fig2, alloc_frame).get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    # 3) Task-allocation tab ---------------------------------------------------
+    def draw_allocation_tab():
+        fig2 = plt.Figure(figsize=(8, 6))
+        fig2.set_layout_engine('none')     # axes fill the figure, no solver needed
+        ax2 = fig2.add_subplot(111)
+
+        palette = ['tab:red', 'tab:green', 'tab:blue', 'tab:orange', 'tab:purple',
+                   'tab:brown', 'tab:pink', 'tab:olive', 'tab:cyan']
+        colour = {}
+        for i, s in enumerate(sorted(workstations)):
+            for t in workstations[s]:
+                colour[t] = palette[i % len(palette)]
+        node_colours = [colour.get(t, 'lightgray') for t in succ]
+
+        draw_precedence_graph(ax2, succ, pos, node_colours)
+
+        patches = [mpatches.Patch(color=palette[i % len(palette)], label=f'Station {s}')
+                   for i, s in enumerate(sorted(workstations))]
+        ax2.legend(handles=patches, loc='best')
+        ax2.set_title('Task allocation')
+        canvas2 = FigureCanvasTkAgg(fig2, alloc_frame)
+        canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas2.draw_idle()               # render once Tk is idle, coalescing redraws
+
+    pending = {1: draw_precedence_tab, 2: draw_allocation_tab}
+
+    def on_tab_changed(event):
+        draw_tab = pending.pop(notebook.index("current"), None)
+        if draw_tab is not None:
+            draw_tab()
+
+    notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
 
     return root
 
@@ -220,12 +389,13 @@ def main_with_gui():
     }
     cycle_time = 60  # seconds
 
-
+    check_predecessors(tasks, predecessors)
+    succ, pos = build_graph(tasks, predecessors)
 
     workstations, metrics = line_balancing_algorithm(
-        tasks, times, predecessors, cycle_time, heuristic="longest_task_time"
+        tasks, times, predecessors, cycle_time, heuristic="longest_task_time", succ=succ
     )
-    root = create_line_balancing_gui(workstations, metrics, tasks, predecessors)
+    root = create_line_balancing_gui(workstations, metrics, tasks, predecessors, succ, pos)
     root.mainloop()
 
     # ────────────────────────────────────────────────────────────────────────────────
@@ -2,22 +2,53 @@
 # Imports
 # ────────────────────────────────────────────────────────────────────────────────
 import collections
-import tkinter as tk
-from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.patches as mpatches
-import networkx as nx
+import graphlib
+import heapq
+import math
+# matplotlib / tkinter are imported lazily by the drawing and GUI helpers
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Helper: successor map {task: [tasks that directly follow it]}
+# ────────────────────────────────────────────────────────────────────────────────
+def successors(tasks, predecessors):
+    """Invert the predecessor lists into a successor adjacency dict."""
+    succ = {t: [] for t in tasks}
+    for t in tasks:
+        for p in dict.fromkeys(predecessors.get(t, ())):   # repeated edges count once
+            succ[p].append(t)
+    return succ
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Helper: reject predecessors that are not in the task list
+# ────────────────────────────────────────────────────────────────────────────────
+def check_predecessors(tasks, predecessors):
+    """Raise ValueError if any task names a predecessor missing from *tasks*."""
+    known = set(tasks)
+    for t in tasks:
+        for p in predecessors.get(t, ()):
+            if p not in known:
+                raise ValueError(f"Task '{t}' has unknown predecessor '{p}' – "
+                                 "check precedence data.")
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Helper: deterministic tree layout (root left, successors to the right)
 # ────────────────────────────────────────────────────────────────────────────────
-def tree_lr_layout(G: nx.DiGraph, x_spacing: float = 2.0, y_spacing: float = 1.5):
+def tree_lr_layout(tasks, predecessors, x_spacing: float = 2.0, y_spacing: float = 1.5,
+                   succ=None):
     """Arrange a DAG like a left-to-right tree and return {node: (x, y)}."""
-    level = {}
-    for node in nx.topological_sort(G):
-        preds = list(G.predecessors(node))
-        level[node] = 0 if not preds else 1 + max(level[p] for p in preds)
+    if succ is None:
+        succ = successors(tasks, predecessors)
+    indeg = {t: len(set(predecessors.get(t, ()))) for t in tasks}
+
+    q = collections.deque(t for t in tasks if indeg[t] == 0)
+    level = {t: 0 for t in q}
+    while q:                                           # Kahn's algorithm
+        u = q.popleft()
+        for v in succ[u]:
+            level[v] = max(level.get(v, 0), level[u] + 1)
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                q.append(v)
 
     columns = collections.defaultdict(list)
     for node, lvl in level.items():
@@ -32,71 +63,185 @@ def tree_lr_layout(G: nx.DiGraph, x_spacing: float = 2.0, y_spacing: float = 1.5
             pos[node] = (lvl * x_spacing, (top - i) * y_spacing)
     return pos
 
+# ────────────────────────────────────────────────────────────────────────────────
+# Helper: precedence graph + layout, built once and shared
+# ────────────────────────────────────────────────────────────────────────────────
+def build_graph(tasks, predecessors):
+    """Return (succ, pos): successor map and layout of the precedence network."""
+    succ = successors(tasks, predecessors)
+    return succ, tree_lr_layout(tasks, predecessors, succ=succ)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Helper: draw the precedence graph with one artist per element type
+# ────────────────────────────────────────────────────────────────────────────────
+def draw_precedence_graph(ax, succ, pos, node_colours, node_size=2000):
+    """Draw the graph on *ax*: edges as one LineCollection, arrowheads as one
+    quiver and nodes as one scatter. *node_colours* follows the order of *succ*."""
+    from matplotlib.collections import LineCollection
+
+    edges = [(pos[u], pos[v]) for u in succ for v in succ[u]]
+    ax.add_collection(LineCollection(edges, colors='k', zorder=1))
+    xs, ys = zip(*(pos[t] for t in succ))
+    ax.scatter(xs, ys, s=node_size, c=node_colours, zorder=2)
+    for t in succ:
+        ax.text(*pos[t], str(t), ha='center', va='center',
+                fontsize=12, fontweight='bold', zorder=3)
+    ax.margins(0.1)
+    ax.set_axis_off()
+    if not edges:
+        return
+
+    # Arrowheads: node size is fixed in points, so the heads are placed in
+    # display space just outside each target node and re-placed on resize.
+    head_len = 18                                      # pixels
+    heads = ax.quiver([v[0] for _, v in edges], [v[1] for _, v in edges],
+                      [1] * len(edges), [0] * len(edges),
+                      angles='uv', scale_units='dots', scale=1, units='dots',
+                      pivot='tip', width=2, headwidth=6, headlength=9,
+                      headaxislength=8, color='k', zorder=3)
+
+    def place_heads(event=None):
+        ax.get_xlim()                                  # settle autoscaled limits
+        to_px = ax.transData.transform
+        radius = math.sqrt(node_size) / 2 * ax.figure.dpi / 72
+        tips, us, vs = [], [], []
+        for (x0, y0), (x1, y1) in zip(to_px([u for u, _ in edges]),
+                                      to_px([v for _, v in edges])):
+            length = math.hypot(x1 - x0, y1 - y0) or 1.0
+            ux, uy = (x1 - x0) / length, (y1 - y0) / length
+            tips.append((x1 - ux * radius, y1 - uy * radius))
+            us.append(ux * head_len)
+            vs.append(uy * head_len)
+        heads.set_offsets(ax.transData.inverted().transform(tips))
+        heads.set_UVC(us, vs)
+
+    place_heads()
+    ax.figure.canvas.mpl_connect('resize_event', place_heads)
+
 # ────────────────────────────────────────────────────────────────────────────────
 # Positional-weight computation
 # ────────────────────────────────────────────────────────────────────────────────
-def compute_positional_weights(tasks, times, predecessors):
-    """Return {task: positional weight}."""
-    G = nx.DiGraph()
-    G.add_nodes_from(tasks)
-    for t, preds in predecessors.items():
-        for p in preds:
-            G.add_edge(p, t)
+def compute_positional_weights(tasks, times, predecessors, succ=None):
+    """Return {task: positional weight}; *succ* may be a prebuilt successor map."""
+    if succ is None:
+        succ = successors(tasks, predecessors)
 
-    topo = list(nx.topological_sort(G))[::-1]          # leaves → roots
+    ts = graphlib.TopologicalSorter({t: predecessors.get(t, ()) for t in tasks})
     pw = {t: times[t] for t in tasks}
-    for node in topo:
-        for succ in G.successors(node):
-            pw[node] += pw[succ]
+    for node in reversed(list(ts.static_order())):
+        for s in succ[node]:
+            pw[node] += pw[s]
     return pw
 
 # ────────────────────────────────────────────────────────────────────────────────
-# Line-balancing algorithm (unchanged except for the call to compute_positional_weights)
+# Line-balancing algorithm
 # ────────────────────────────────────────────────────────────────────────────────
 def line_balancing_algorithm(tasks, times, predecessors,
-                              cycle_time, heuristic="longest_task_time"):
+                              cycle_time, heuristic="longest_task_time", packing="next_fit",
+                              succ=None):
+    if not tasks:
+        raise ValueError("No tasks – nothing to balance.")
+    if heuristic not in ("longest_task_time", "ranked_positional_weight"):
+        raise ValueError(f"Unknown heuristic '{heuristic}' – "
+                         "use 'longest_task_time' or 'ranked_positional_weight'.")
+    if packing not in ("next_fit", "first_fit"):
+        raise ValueError(f"Unknown packing '{packing}' – use 'next_fit' or 'first_fit'.")
+    check_predecessors(tasks, predecessors)
 
     total_work = sum(times.values())
-    min_stations = max(1, int((total_work + cycle_time - 0.01)//cycle_time))
+    if isinstance(total_work, int) and isinstance(cycle_time, int):
+        min_stations = max(1, -(-total_work // cycle_time))
+    else:                                              # absorb float noise, e.g. 0.1 + 0.2
+        min_stations = max(1, math.ceil(round(total_work / cycle_time, 9)))
 
     workstations, st_times = {}, {}
-    assigned, ws = set(), 1
+    ws = 1
     st_times[ws] = 0
 
     if heuristic == "ranked_positional_weight":
-        pw = compute_positional_weights(tasks, times, predecessors)
-
-    def eligible(t):
-        return t not in assigned and all(p in assigned for p in predecessors.get(t, []))
-
-    while len(assigned) < len(tasks):
-        cand = [t for t in tasks if eligible(t)]
-        if not cand:
+        key = compute_positional_weights(tasks, times, predecessors, succ=succ)
+    else:
+        key = times
+
+    # integer ids (index into `tasks`) for the hot loops; the id also breaks ties
+    n = len(tasks)
+    idx = {t: i for i, t in enumerate(tasks)}
+    dur = [times[t] for t in tasks]
+    entry = [(-key[t], i) for i, t in enumerate(tasks)]   # prebuilt heap items
+    nxt = [[] for _ in range(n)]
+    remaining = [0] * n
+    for i, t in enumerate(tasks):          # in-degrees and successor ids in one pass
+        preds = dict.fromkeys(predecessors.get(t, ()))
+        remaining[i] = len(preds)
+        for p in preds:
+            nxt[idx[p]].append(i)
+    done = 0
+
+    # ready heap (Kahn)
+    ready = [entry[i] for i in range(n) if remaining[i] == 0]
+    heapq.heapify(ready)
+
+    if packing == "first_fit":
+        # each task goes to the first station with room that is not before its predecessors
+        earliest = [1] * n
+        while ready:
+            i = heapq.heappop(ready)[1]
+            if dur[i] > cycle_time:
+                raise ValueError(f"Task '{tasks[i]}' is longer than the cycle time.")
+            s = earliest[i]
+            while s in st_times and st_times[s] + dur[i] > cycle_time:
+                s += 1
+            workstations.setdefault(s, []).append(tasks[i])
+            st_times[s] = st_times.get(s, 0) + dur[i]
+            done += 1
+            for v in nxt[i]:
+                earliest[v] = max(earliest[v], s)
+                remaining[v] -= 1
+                if remaining[v] == 0:
+                    heapq.heappush(ready, entry[v])
+        if done < n:
             raise ValueError("No eligible tasks – check precedence data.")
-
-        if heuristic == "longest_task_time":
-            cand.sort(key=lambda t: times[t], reverse=True)
-        else:
-            cand.sort(key=lambda t: pw[t], reverse=True)
-
-        placed = False
-        for t in cand:
-            if st_times[ws] + times[t] <= cycle_time:
-                workstations.setdefault(ws, []).append(t)
-                st_times[ws] += times[t]
-                assigned.add(t)
-                placed = True
-                break
-        if not placed:
-            ws += 1
-            st_times[ws] = 0
-
-    idle = sum(cycle_time - st_times[s] for s in st_times)
-    eff = (total_work / (len(workstations) * cycle_time)) * 100
+    else:
+        # next fit: tasks that don't fit wait in `deferred` for the next station
+        deferred = []
+        load = 0
+        shortest = min(dur)
+        while done < n:
+            if ready and load + shortest > cycle_time:   # station is full
+                deferred += ready
+                ready = []
+            if not ready:
+                if not deferred:
+                    raise ValueError("No eligible tasks – check precedence data.")
+                if load == 0:
+                    raise ValueError(f"Task '{tasks[deferred[0][1]]}' is longer than the cycle time.")
+                ws += 1
+                st_times[ws] = load = 0
+                ready, deferred = deferred, []
+                heapq.heapify(ready)
+                continue
+
+            item = heapq.heappop(ready)
+            i = item[1]
+            if load + dur[i] <= cycle_time:
+                workstations.setdefault(ws, []).append(tasks[i])
+                load += dur[i]
+                st_times[ws] = load
+                done += 1
+                for v in nxt[i]:
+                    remaining[v] -= 1
+                    if remaining[v] == 0:
+                        heapq.heappush(ready, entry[v])
+            else:
+                deferred.append(item)
+
+    n_ws = len(workstations)
+    idle = n_ws * cycle_time - total_work
+    eff = (total_work / (n_ws * cycle_time)) * 100
     metrics = dict(total_work_content=total_work,
                    cycle_time=cycle_time,
                    min_stations=min_stations,
-                   actual_stations=len(workstations),
+                   actual_stations=n_ws,
                    idle_time=idle,
                    efficiency=eff,
                    balance_delay=100-eff,
@@ -104,9 +249,15 @@ def line_balancing_algorithm(tasks, times, predecessors,
     return workstations, metrics
 
 # ────────────────────────────────────────────────────────────────────────────────
-# GUI (unchanged)
+# GUI
 # ────────────────────────────────────────────────────────────────────────────────
-def create_line_balancing_gui(workstations, metrics, tasks, predecessors):
+def create_line_balancing_gui(workstations, metrics, tasks, predecessors, succ=None, pos=None):
+    import tkinter as tk
+    from tkinter import ttk
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    import matplotlib.patches as mpatches
+
     root = tk.Tk()
     root.title("Line Balancing Results")
     root.geometry("1200x800")
@@ -119,11 +270,13 @@ def create_line_balancing_gui(workstations, metrics, tasks, predecessors):
 
     lf_ws = ttk.LabelFrame(res_f, text="Workstation Assignments")
     lf_ws.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+    lines = []
     for s in sorted(workstations):
         tasks_str = ", ".join(workstations[s])
-        ttk.Label(lf_ws, text=f"Station {s}: {tasks_str}").grid(sticky="w")
-        ttk.Label(lf_ws, text=f"  Total time: {metrics['station_times'][s]} sec").grid(sticky="w")
-        ttk.Label(lf_ws, text=f"  Idle time: {metrics['cycle_time'] - metrics['station_times'][s]} sec").grid(sticky="w")
+        lines += [f"Station {s}: {tasks_str}",
+                  f"  Total time: {metrics['station_times'][s]} sec",
+                  f"  Idle time: {metrics['cycle_time'] - metrics['station_times'][s]} sec"]
+    ttk.Label(lf_ws, text="\n".join(lines), justify="left").grid(sticky="w")
 
     lf_met = ttk.LabelFrame(res_f, text="Performance Metrics")
     lf_met.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
@@ -136,37 +289,48 @@ def create_line_balancing_gui(workstations, metrics, tasks, predecessors):
     ttk.Label(lf_met, text=msg).grid(sticky="w")
 
     # ----- Graphs common data -------------------------------------------------
-    G = nx.DiGraph()
-    G.add_nodes_from(tasks)
-    for t, preds in predecessors.items():
-        for p in preds:  G.add_edge(p, t)
-    pos = tree_lr_layout(G)
+    if succ is None or pos is None:
+        succ, pos = build_graph(tasks, predecessors)
 
-    # ----- Precedence network -------------------------------------------------
+    # ----- Graph tabs (drawn on first selection) ------------------------------
     topo_f = ttk.Frame(nb); nb.add(topo_f, text="Task Precedence Network")
-    fig1 = plt.Figure(figsize=(8, 6)); ax1 = fig1.add_subplot(111)
-    nx.draw(G, pos, ax=ax1, with_labels=True, node_size=2000,
-            node_color='lightblue', font_size=12, font_weight='bold', arrowsize=20)
-    ax1.set_title('Precedence graph')
-    FigureCanvasTkAgg(fig1, topo_f).get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-    # ----- Task allocation ----------------------------------------------------
     alloc_f = ttk.Frame(nb); nb.add(alloc_f, text="Task Allocation")
-    fig2 = plt.Figure(figsize=(8, 6)); ax2 = fig2.add_subplot(111)
-    palette = ['tab:red', 'tab:green', 'tab:blue', 'tab:orange', 'tab:purple',
-               'tab:brown', 'tab:pink', 'tab:olive', 'tab:cyan']
-    colour = {}
-    for i, s in enumerate(sorted(workstations)):
-        for t in workstations[s]:
-            colour[t] = palette[i % len(palette)]
-    nx.draw(G, pos, ax=ax2, with_labels=True, node_size=2000,
-            node_color=[colour.get(t, 'lightgray') for t in tasks],
-            font_size=12, font_weight='bold', arrowsize=20)
-    patches = [mpatches.Patch(color=palette[i % len(palette)], label=f'Station {s}')
-               for i, s in enumerate(sorted(workstations))]
-    ax2.legend(handles=patches, loc='best')
-    ax2.set_title('Task allocation')
-    FigureCanvasTkAgg(fig2, alloc_f).get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def draw_precedence_tab():
+        fig1 = plt.Figure(figsize=(8, 6)); fig1.set_layout_engine('none')
+        ax1 = fig1.add_subplot(111)
+        draw_precedence_graph(ax1, succ, pos, 'lightblue')
+        ax1.set_title('Precedence graph')
+        cv1 = FigureCanvasTkAgg(fig1, topo_f)
+        cv1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        cv1.draw_idle()
+
+    def draw_allocation_tab():
+        fig2 = plt.Figure(figsize=(8, 6)); fig2.set_layout_engine('none')
+        ax2 = fig2.add_subplot(111)
+        palette = ['tab:red', 'tab:green', 'tab:blue', 'tab:orange', 'tab:purple',
+                   'tab:brown', 'tab:pink', 'tab:olive', 'tab:cyan']
+        colour = {}
+        for i, s in enumerate(sorted(workstations)):
+            for t in workstations[s]:
+                colour[t] = palette[i % len(palette)]
+        draw_precedence_graph(ax2, succ, pos, [colour.get(t, 'lightgray') for t in succ])
+        patches = [mpatches.Patch(color=palette[i % len(palette)], label=f'Station {s}')
+                   for i, s in enumerate(sorted(workstations))]
+        ax2.legend(handles=patches, loc='best')
+        ax2.set_title('Task allocation')
+        cv2 = FigureCanvasTkAgg(fig2, alloc_f)
+        cv2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        cv2.draw_idle()
+
+    pending = {1: draw_precedence_tab, 2: draw_allocation_tab}
+
+    def on_tab(event):
+        draw = pending.pop(nb.index("current"), None)
+        if draw is not None:
+            draw()
+
+    nb.bind("<<NotebookTabChanged>>", on_tab)
 
     return root
 
@@ -187,8 +351,10 @@ def collect_data_from_user():
     cycle_time = float(input("\nEnter desired cycle time (sec): ").strip())
     rule = input("Heuristic – (1) longest task time  (2) ranked positional weight [default 1]: ").strip()
     heuristic = "ranked_positional_weight" if rule == "2" else "longest_task_time"
+    fit = input("Packing – (1) next fit  (2) first fit [default 1]: ").strip()
+    packing = "first_fit" if fit == "2" else "next_fit"
 
-    return tasks, times, predecessors, cycle_time, heuristic
+    return tasks, times, predecessors, cycle_time, heuristic, packing
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Main
@@ -222,6 +388,7 @@ def main():
         }
         cycle_time = 10
         heuristic  = "ranked_positional_weight"
+        packing    = "next_fit"
 
     # ---------------------------------------------------------------------
     # 2)  Manual entry: we already have the first line (the task list)
@@ -239,14 +406,18 @@ def main():
         cycle_time = float(input("\nEnter desired cycle time (sec): ").strip())
         rule = input("Heuristic – (1) longest task time  (2) ranked positional weight [default 1]: ").strip()
         heuristic = "ranked_positional_weight" if rule == "2" else "longest_task_time"
+        fit = input("Packing – (1) next fit  (2) first fit [default 1]: ").strip()
+        packing = "first_fit" if fit == "2" else "next_fit"
 
     # ---------------------------------------------------------------------
     # 3)  Run algorithm & launch GUI
     # ---------------------------------------------------------------------
+    check_predecessors(tasks, predecessors)
+    succ, pos = build_graph(tasks, predecessors)
     workstations, metrics = line_balancing_algorithm(
-        tasks, times, predecessors, cycle_time, heuristic)
+        tasks, times, predecessors, cycle_time, heuristic, packing, succ=succ)
 
-    root = create_line_balancing_gui(workstations, metrics, tasks, predecessors)
+    root = create_line_balancing_gui(workstations, metrics, tasks, predecessors, succ, pos)
     root.mainloop()
 
 